@@ -1,5 +1,7 @@
 """The Webhook Actions integration."""
+from collections.abc import Callable, Coroutine
 import logging
+import sys
 from typing import Any
 
 import voluptuous as vol
@@ -9,6 +11,8 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    CONF_BATCH_SIZE,
+    CONF_BATCH_WAIT_MS,
     CONF_HEADERS,
     CONF_HEADERS_OVERRIDE,
     CONF_METHOD,
@@ -22,31 +26,40 @@ from .const import (
     CONF_URL_OVERRIDE,
     CONF_WEBHOOK_ID,
     CONF_WEBHOOKS,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_WAIT_MS,
     DEFAULT_METHOD,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_TIMEOUT,
     DOMAIN,
-    HTTP_METHODS,
+    HTTP_METHODS_SET,
     SERVICE_CALL,
 )
 from .storage import WebhookConfigManager
-from .webhook import WebhookExecutor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sub-schemas shared by the YAML and service call schemas
+_HEADERS_SCHEMA = vol.Schema({cv.string: cv.string})
+_PAYLOAD_SCHEMA = vol.Any(cv.string, dict, list)
+
 # YAML configuration schema
 WEBHOOK_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_WEBHOOK_ID): cv.string,
         vol.Required(CONF_NAME): cv.string,
         vol.Required(CONF_URL): cv.string,
-        vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(HTTP_METHODS),
-        vol.Optional(CONF_HEADERS, default={}): vol.Schema({cv.string: cv.string}),
-        vol.Optional(CONF_PAYLOAD): vol.Any(cv.string, dict, list),
+        vol.Optional(CONF_METHOD, default=DEFAULT_METHOD): vol.In(HTTP_METHODS_SET),
+        vol.Optional(CONF_HEADERS, default={}): _HEADERS_SCHEMA,
+        vol.Optional(CONF_PAYLOAD): _PAYLOAD_SCHEMA,
         vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): cv.positive_int,
         vol.Optional(
             CONF_RETRY_ATTEMPTS, default=DEFAULT_RETRY_ATTEMPTS
         ): cv.positive_int,
+        vol.Optional(CONF_BATCH_SIZE, default=DEFAULT_BATCH_SIZE): cv.positive_int,
+        vol.Optional(
+            CONF_BATCH_WAIT_MS, default=DEFAULT_BATCH_WAIT_MS
+        ): cv.positive_int,
     }
 )
 
@@ -63,6 +76,17 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+# Service call schema, built once at import time
+SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_WEBHOOK_ID): cv.string,
+        vol.Optional(CONF_URL_OVERRIDE): cv.string,
+        vol.Optional(CONF_HEADERS_OVERRIDE): _HEADERS_SCHEMA,
+        vol.Optional(CONF_PAYLOAD_OVERRIDE): _PAYLOAD_SCHEMA,
+        vol.Optional(CONF_TIMEOUT_OVERRIDE): cv.positive_int,
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Webhook Actions component from YAML."""
@@ -146,42 +170,48 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     _LOGGER.info("Webhook entry updated: %s", entry.data[CONF_NAME])
 
 
-async def async_setup_services(
-    hass: HomeAssistant, config_manager: WebhookConfigManager
-) -> None:
-    """Set up webhook services."""
+def _make_handler(
+    config_manager: WebhookConfigManager,
+) -> Callable[[ServiceCall], Coroutine[Any, Any, ServiceResponse]]:
+    """Create the webhook call service handler bound to a config manager."""
+    # Bind once so each call skips the attribute lookup on config_manager
+    get_executor = config_manager.get_executor
 
     async def handle_webhook_call(call: ServiceCall) -> ServiceResponse:
         """Handle webhook call service."""
-        webhook_id = call.data[CONF_WEBHOOK_ID]
-
-        # Get webhook config
-        webhook_config = config_manager.get_webhook(webhook_id)
-        if not webhook_config:
+        data = call.data
+        # Interned IDs let the executor cache lookup match on identity (str() as
+        # cv.string may pass str subclasses through, which sys.intern rejects)
+        webhook_id = sys.intern(str(data[CONF_WEBHOOK_ID]))
+
+        # Get (cached) executor for the webhook config
+        executor = get_executor(webhook_id)
+        if executor is None:
             raise HomeAssistantError(f"Webhook '{webhook_id}' not found")
 
         # Extract overrides
-        url_override = call.data.get(CONF_URL_OVERRIDE)
-        headers_override = call.data.get(CONF_HEADERS_OVERRIDE)
-        payload_override = call.data.get(CONF_PAYLOAD_OVERRIDE)
-        timeout_override = call.data.get(CONF_TIMEOUT_OVERRIDE)
+        url_override = data.get(CONF_URL_OVERRIDE)
+        headers_override = data.get(CONF_HEADERS_OVERRIDE)
+        payload_override = data.get(CONF_PAYLOAD_OVERRIDE)
+        timeout_override = data.get(CONF_TIMEOUT_OVERRIDE)
 
         # Execute webhook
-        executor = WebhookExecutor(hass, webhook_config)
-
         try:
             response = await executor.execute(
                 url_override=url_override,
                 headers_override=headers_override,
                 payload_override=payload_override,
                 timeout_override=timeout_override,
+                # Headers are only needed when the caller asked for the response
+                include_headers=call.return_response,
             )
 
-            _LOGGER.debug(
-                "Webhook %s executed successfully: HTTP %s",
-                webhook_id,
-                response["status_code"],
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Webhook %s executed successfully: HTTP %s",
+                    webhook_id,
+                    response["status_code"],
+                )
 
             return response
 
@@ -189,23 +219,18 @@ async def async_setup_services(
             _LOGGER.error("Webhook %s execution failed: %s", webhook_id, err)
             raise HomeAssistantError(f"Webhook execution failed: {err}") from err
 
-    # Service schema
-    service_schema = vol.Schema(
-        {
-            vol.Required(CONF_WEBHOOK_ID): cv.string,
-            vol.Optional(CONF_URL_OVERRIDE): cv.string,
-            vol.Optional(CONF_HEADERS_OVERRIDE): vol.Schema({cv.string: cv.string}),
-            vol.Optional(CONF_PAYLOAD_OVERRIDE): vol.Any(cv.string, dict, list),
-            vol.Optional(CONF_TIMEOUT_OVERRIDE): cv.positive_int,
-        }
-    )
+    return handle_webhook_call
 
-    # Register service
+
+async def async_setup_services(
+    hass: HomeAssistant, config_manager: WebhookConfigManager
+) -> None:
+    """Set up webhook services."""
     hass.services.async_register(
         DOMAIN,
         SERVICE_CALL,
-        handle_webhook_call,
-        schema=service_schema,
+        _make_handler(config_manager),
+        schema=SERVICE_SCHEMA,
         supports_response=SupportsResponse.OPTIONAL,
     )
 
@@ -1,7 +1,7 @@
 """Config flow for Webhook Actions integration."""
 import logging
+import re
 from typing import Any
-from urllib.parse import urlparse
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -10,6 +10,8 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from .const import (
+    CONF_BATCH_SIZE,
+    CONF_BATCH_WAIT_MS,
     CONF_HEADERS,
     CONF_METHOD,
     CONF_NAME,
@@ -18,6 +20,8 @@ from .const import (
     CONF_TIMEOUT,
     CONF_URL,
     CONF_WEBHOOK_ID,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_WAIT_MS,
     DEFAULT_METHOD,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_TIMEOUT,
@@ -27,6 +31,76 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# http(s) scheme followed by a non-empty host
+_URL_RE = re.compile(r"^https?://[^/?#\s]+", re.IGNORECASE)
+
+# Defaults for optional fields omitted from the user step (immutable values only;
+# headers get a fresh dict per entry so entries never share a container)
+_DEFAULTS: dict[str, Any] = {
+    CONF_METHOD: DEFAULT_METHOD,
+    CONF_PAYLOAD: None,
+    CONF_TIMEOUT: DEFAULT_TIMEOUT,
+    CONF_RETRY_ATTEMPTS: DEFAULT_RETRY_ATTEMPTS,
+    CONF_BATCH_SIZE: DEFAULT_BATCH_SIZE,
+    CONF_BATCH_WAIT_MS: DEFAULT_BATCH_WAIT_MS,
+}
+
+# Schema for the user step, built once at import time
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_WEBHOOK_ID): str,
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_URL): str,
+        vol.Required(CONF_METHOD, default=DEFAULT_METHOD): selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(HTTP_METHODS),
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            )
+        ),
+        vol.Optional(CONF_HEADERS): selector.ObjectSelector(),
+        vol.Optional(CONF_PAYLOAD): selector.ObjectSelector(),
+        vol.Optional(
+            CONF_TIMEOUT, default=DEFAULT_TIMEOUT
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=300,
+                unit_of_measurement="seconds",
+            )
+        ),
+        vol.Optional(
+            CONF_RETRY_ATTEMPTS, default=DEFAULT_RETRY_ATTEMPTS
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=10,
+            )
+        ),
+        vol.Optional(
+            CONF_BATCH_SIZE, default=DEFAULT_BATCH_SIZE
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=1000,
+            )
+        ),
+        vol.Optional(
+            CONF_BATCH_WAIT_MS, default=DEFAULT_BATCH_WAIT_MS
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=1,
+                max=10000,
+                unit_of_measurement="ms",
+            )
+        ),
+    }
+)
+
+
+def _is_valid_url(url: str) -> bool:
+    """Validate URL format."""
+    return _URL_RE.match(url) is not None
+
 
 class WebhookActionsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Webhook Actions."""
@@ -47,81 +121,34 @@ class WebhookActionsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if self._webhook_id_exists(webhook_id):
                 errors[CONF_WEBHOOK_ID] = "webhook_id_exists"
             # Validate URL format
-            elif not self._is_valid_url(url):
+            elif not _is_valid_url(url):
                 errors[CONF_URL] = "invalid_url"
             else:
                 # Create entry
                 return self.async_create_entry(
                     title=user_input[CONF_NAME],
-                    data={
-                        CONF_WEBHOOK_ID: webhook_id,
-                        CONF_NAME: user_input[CONF_NAME],
-                        CONF_URL: user_input[CONF_URL],
-                        CONF_METHOD: user_input.get(CONF_METHOD, DEFAULT_METHOD),
-                        CONF_HEADERS: user_input.get(CONF_HEADERS, {}),
-                        CONF_PAYLOAD: user_input.get(CONF_PAYLOAD),
-                        CONF_TIMEOUT: user_input.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-                        CONF_RETRY_ATTEMPTS: user_input.get(
-                            CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS
-                        ),
-                    },
+                    data={**_DEFAULTS, CONF_HEADERS: {}, **user_input},
                 )
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_WEBHOOK_ID): str,
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_URL): str,
-                vol.Required(CONF_METHOD, default=DEFAULT_METHOD): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=HTTP_METHODS,
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(CONF_HEADERS): selector.ObjectSelector(),
-                vol.Optional(CONF_PAYLOAD): selector.ObjectSelector(),
-                vol.Optional(
-                    CONF_TIMEOUT, default=DEFAULT_TIMEOUT
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=300,
-                        unit_of_measurement="seconds",
-                    )
-                ),
-                vol.Optional(
-                    CONF_RETRY_ATTEMPTS, default=DEFAULT_RETRY_ATTEMPTS
-                ): selector.NumberSelector(
-                    selector.NumberSelectorConfig(
-                        min=1,
-                        max=10,
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
     def _webhook_id_exists(self, webhook_id: str) -> bool:
         """Check if webhook ID already exists."""
-        # Check in config entries
-        for entry in self._async_current_entries():
-            if entry.data.get(CONF_WEBHOOK_ID) == webhook_id:
-                return True
-        return False
-
-    def _is_valid_url(self, url: str) -> bool:
-        """Validate URL format."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc]) and result.scheme in ["http", "https"]
-        except Exception:
-            return False
+        # Indexed lookup across loaded UI and YAML webhooks
+        config_manager = self.hass.data.get(DOMAIN, {}).get("config_manager")
+        if config_manager is not None and config_manager.webhook_exists(webhook_id):
+            return True
+
+        # Config entries that are not loaded (e.g. disabled) are not indexed
+        return webhook_id in {
+            entry.data.get(CONF_WEBHOOK_ID)
+            for entry in self._async_current_entries()
+        }
 
     @staticmethod
     @callback
@@ -149,7 +176,7 @@ class WebhookActionsOptionsFlow(config_entries.OptionsFlow):
             url = user_input[CONF_URL]
 
             # Validate URL format
-            if not self._is_valid_url(url):
+            if not _is_valid_url(url):
                 errors[CONF_URL] = "invalid_url"
             else:
                 # Update config entry (including title shown in UI)
@@ -165,6 +192,8 @@ class WebhookActionsOptionsFlow(config_entries.OptionsFlow):
                         CONF_PAYLOAD: user_input.get(CONF_PAYLOAD),
                         CONF_TIMEOUT: user_input[CONF_TIMEOUT],
                         CONF_RETRY_ATTEMPTS: user_input[CONF_RETRY_ATTEMPTS],
+                        CONF_BATCH_SIZE: user_input[CONF_BATCH_SIZE],
+                        CONF_BATCH_WAIT_MS: user_input[CONF_BATCH_WAIT_MS],
                     },
                 )
                 return self.async_create_entry(title="", data={})
@@ -184,7 +213,7 @@ class WebhookActionsOptionsFlow(config_entries.OptionsFlow):
                     default=current_data.get(CONF_METHOD, DEFAULT_METHOD),
                 ): selector.SelectSelector(
                     selector.SelectSelectorConfig(
-                        options=HTTP_METHODS,
+                        options=list(HTTP_METHODS),
                         mode=selector.SelectSelectorMode.DROPDOWN,
                     )
                 ),
@@ -215,6 +244,25 @@ class WebhookActionsOptionsFlow(config_entries.OptionsFlow):
                         max=10,
                     )
                 ),
+                vol.Optional(
+                    CONF_BATCH_SIZE,
+                    default=current_data.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=1000,
+                    )
+                ),
+                vol.Optional(
+                    CONF_BATCH_WAIT_MS,
+                    default=current_data.get(CONF_BATCH_WAIT_MS, DEFAULT_BATCH_WAIT_MS),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=10000,
+                        unit_of_measurement="ms",
+                    )
+                ),
             }
         )
 
@@ -226,11 +274,3 @@ class WebhookActionsOptionsFlow(config_entries.OptionsFlow):
                 "webhook_id": current_data.get(CONF_WEBHOOK_ID, "unknown")
             },
         )
-
-    def _is_valid_url(self, url: str) -> bool:
-        """Validate URL format."""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc]) and result.scheme in ["http", "https"]
-        except Exception:
-            return False
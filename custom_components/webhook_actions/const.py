@@ -13,6 +13,8 @@ CONF_PAYLOAD = "payload"
 CONF_TIMEOUT = "timeout"
 CONF_RETRY_ATTEMPTS = "retry_attempts"
 CONF_RETRY_BACKOFF = "retry_backoff"
+CONF_BATCH_SIZE = "batch_size"
+CONF_BATCH_WAIT_MS = "batch_wait_ms"
 
 # Service call overrides
 CONF_URL_OVERRIDE = "url_override"
@@ -21,15 +23,24 @@ CONF_PAYLOAD_OVERRIDE = "payload_override"
 CONF_TIMEOUT_OVERRIDE = "timeout"
 
 # HTTP methods
-HTTP_METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"]
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+HTTP_METHODS_SET = frozenset(HTTP_METHODS)
 
 # Default values
 DEFAULT_METHOD = "POST"
 DEFAULT_TIMEOUT = 10
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_BACKOFF = 2
+RETRY_MAX_BACKOFF = 30  # Max seconds between retries (before jitter)
+RETRY_JITTER = 0.5  # Up to +50% random delay so retries don't synchronize
+CIRCUIT_THRESHOLD = 5  # Consecutive failed calls before a target host is short-circuited
+CIRCUIT_COOLDOWN = 30  # Seconds to fail fast before probing the host again
+CIRCUIT_MAX_HOSTS = 256  # Breakers tracked at once; healthy hosts are evicted first
 DEFAULT_HEADERS = {"Content-Type": "application/json"}
+DEFAULT_BATCH_SIZE = 1  # 1 disables batching
+DEFAULT_BATCH_WAIT_MS = 100
 MAX_RESPONSE_SIZE = 1024 * 1024  # 1MB max response size
+BATCH_ROOT_KEY = "events"  # Batched payloads are sent as {"events": [...]}
 
 # Service names
 SERVICE_CALL = "call"
@@ -43,8 +54,10 @@ ERROR_CONNECTION = "connection_error"
 ERROR_TIMEOUT = "timeout_error"
 ERROR_HTTP = "http_error"
 ERROR_TEMPLATE = "template_error"
+ERROR_CIRCUIT_OPEN = "circuit_open"
 ERROR_INVALID_CONFIG = "invalid_config"
 
 # Storage
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.storage"
+STORAGE_SAVE_DELAY = 1  # Seconds to coalesce writes before flushing
@@ -1,16 +1,21 @@
 """Storage handler for webhook configurations."""
+from collections import ChainMap
+from collections.abc import Mapping
 import logging
+import sys
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_WEBHOOK_ID,
     CONF_WEBHOOKS,
     STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
     STORAGE_VERSION,
 )
+from .webhook import WebhookExecutor
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,6 +23,8 @@ _LOGGER = logging.getLogger(__name__)
 class WebhookStorage:
     """Manage webhook configuration storage."""
 
+    __slots__ = ("hass", "store", "data")
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize storage handler."""
         self.hass = hass
@@ -29,45 +36,62 @@ class WebhookStorage:
         data = await self.store.async_load()
         if data:
             self.data = data
-        _LOGGER.debug("Loaded %d webhooks from storage", len(self.data.get(CONF_WEBHOOKS, {})))
+        self.data.setdefault(CONF_WEBHOOKS, {})
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Loaded %d webhooks from storage", len(self.data[CONF_WEBHOOKS]))
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a save, coalescing bursts of changes into a single write."""
+        self.store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
 
-    async def async_save(self) -> None:
-        """Save webhook configurations to storage."""
-        await self.store.async_save(self.data)
-        _LOGGER.debug("Saved %d webhooks to storage", len(self.data.get(CONF_WEBHOOKS, {})))
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write to storage."""
+        return self.data
 
     async def async_add_webhook(self, webhook_id: str, config: dict[str, Any]) -> None:
         """Add or update a webhook configuration."""
-        if CONF_WEBHOOKS not in self.data:
-            self.data[CONF_WEBHOOKS] = {}
+        webhooks = self.data[CONF_WEBHOOKS]
+        # Config entries are replayed on every startup; skip unchanged ones
+        if webhooks.get(webhook_id) == config:
+            return
 
-        self.data[CONF_WEBHOOKS][webhook_id] = config
-        await self.async_save()
+        webhooks[webhook_id] = config
+        self.async_schedule_save()
         _LOGGER.info("Added/updated webhook: %s", webhook_id)
 
     async def async_remove_webhook(self, webhook_id: str) -> None:
         """Remove a webhook configuration."""
-        if webhook_id in self.data.get(CONF_WEBHOOKS, {}):
+        if webhook_id in self.data[CONF_WEBHOOKS]:
             del self.data[CONF_WEBHOOKS][webhook_id]
-            await self.async_save()
+            self.async_schedule_save()
             _LOGGER.info("Removed webhook: %s", webhook_id)
 
     def get_webhook(self, webhook_id: str) -> dict[str, Any] | None:
         """Get a webhook configuration by ID."""
-        return self.data.get(CONF_WEBHOOKS, {}).get(webhook_id)
+        return self.data[CONF_WEBHOOKS].get(webhook_id)
 
     def get_all_webhooks(self) -> dict[str, dict[str, Any]]:
         """Get all webhook configurations."""
-        return self.data.get(CONF_WEBHOOKS, {})
+        return self.data[CONF_WEBHOOKS]
 
     def webhook_exists(self, webhook_id: str) -> bool:
         """Check if a webhook ID exists."""
-        return webhook_id in self.data.get(CONF_WEBHOOKS, {})
+        return webhook_id in self.data[CONF_WEBHOOKS]
 
 
 class WebhookConfigManager:
     """Manage webhook configurations from both YAML and UI sources."""
 
+    __slots__ = (
+        "hass",
+        "yaml_config",
+        "storage",
+        "_yaml_index",
+        "_executors",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -78,60 +102,53 @@ class WebhookConfigManager:
         self.yaml_config = yaml_config or {}
         self.storage = WebhookStorage(hass)
 
+        # Index YAML webhooks by (interned) ID; YAML config does not change at runtime.
+        # YAML strings are str subclasses, which sys.intern rejects, so coerce first.
+        self._yaml_index: dict[str, dict[str, Any]] = {
+            sys.intern(str(webhook[CONF_WEBHOOK_ID])): webhook
+            for webhook in self.yaml_config.get(CONF_WEBHOOKS, [])
+            if webhook.get(CONF_WEBHOOK_ID)
+        }
+        self._executors: dict[str, WebhookExecutor] = {}
+
     async def async_setup(self) -> None:
         """Set up the configuration manager."""
         await self.storage.async_load()
 
-    def get_all_webhooks(self) -> dict[str, dict[str, Any]]:
-        """Get all webhook configurations (merged YAML and UI configs)."""
-        webhooks = {}
-
-        # Start with YAML configs
-        if CONF_WEBHOOKS in self.yaml_config:
-            for webhook in self.yaml_config[CONF_WEBHOOKS]:
-                webhook_id = webhook.get(CONF_WEBHOOK_ID)
-                if webhook_id:
-                    webhooks[webhook_id] = webhook.copy()
-
-        # Overlay UI configs (they take precedence)
-        ui_webhooks = self.storage.get_all_webhooks()
-        webhooks.update(ui_webhooks)
-
-        return webhooks
+    def get_all_webhooks(self) -> Mapping[str, dict[str, Any]]:
+        """Get a read-only view of all webhook configurations (merged YAML and UI configs)."""
+        # UI configs take precedence over YAML
+        return ChainMap(self.storage.get_all_webhooks(), self._yaml_index)
 
     def get_webhook(self, webhook_id: str) -> dict[str, Any] | None:
         """Get a specific webhook configuration."""
-        # Check UI config first (higher priority)
-        ui_webhook = self.storage.get_webhook(webhook_id)
-        if ui_webhook:
-            return ui_webhook
+        # Check UI config first (higher priority), then fall back to YAML
+        return self.storage.get_webhook(webhook_id) or self._yaml_index.get(webhook_id)
+
+    def get_executor(self, webhook_id: str) -> WebhookExecutor | None:
+        """Get a cached executor for a webhook, creating it on first use."""
+        if (executor := self._executors.get(webhook_id)) is not None:
+            return executor
 
-        # Fall back to YAML config
-        if CONF_WEBHOOKS in self.yaml_config:
-            for webhook in self.yaml_config[CONF_WEBHOOKS]:
-                if webhook.get(CONF_WEBHOOK_ID) == webhook_id:
-                    return webhook.copy()
+        webhook_config = self.get_webhook(webhook_id)
+        if not webhook_config:
+            return None
 
-        return None
+        executor = WebhookExecutor(self.hass, webhook_config)
+        self._executors[webhook_id] = executor
+        return executor
 
     async def async_add_webhook(self, webhook_id: str, config: dict[str, Any]) -> None:
         """Add or update a webhook configuration in UI storage."""
+        webhook_id = sys.intern(str(webhook_id))
         await self.storage.async_add_webhook(webhook_id, config)
+        self._executors.pop(webhook_id, None)
 
     async def async_remove_webhook(self, webhook_id: str) -> None:
         """Remove a webhook configuration from UI storage."""
         await self.storage.async_remove_webhook(webhook_id)
+        self._executors.pop(webhook_id, None)
 
     def webhook_exists(self, webhook_id: str) -> bool:
         """Check if a webhook ID exists in either YAML or UI config."""
-        # Check UI storage
-        if self.storage.webhook_exists(webhook_id):
-            return True
-
-        # Check YAML config
-        if CONF_WEBHOOKS in self.yaml_config:
-            for webhook in self.yaml_config[CONF_WEBHOOKS]:
-                if webhook.get(CONF_WEBHOOK_ID) == webhook_id:
-                    return True
-
-        return False
+        return self.storage.webhook_exists(webhook_id) or webhook_id in self._yaml_index
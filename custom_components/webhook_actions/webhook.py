@@ -1,16 +1,34 @@
 """Webhook execution logic for Webhook Actions."""
 import asyncio
+import codecs
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 import json
 import logging
+import random
+import re
+import time
 from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, TemplateError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.template import Template
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+from yarl import URL
 
 from .const import (
+    BATCH_ROOT_KEY,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_MAX_HOSTS,
+    CIRCUIT_THRESHOLD,
+    CONF_BATCH_SIZE,
+    CONF_BATCH_WAIT_MS,
     CONF_HEADERS,
     CONF_METHOD,
     CONF_PAYLOAD,
@@ -19,9 +37,14 @@ from .const import (
     CONF_TIMEOUT,
     CONF_URL,
     CONF_WEBHOOK_ID,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BATCH_WAIT_MS,
+    DEFAULT_HEADERS,
+    DEFAULT_METHOD,
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_BACKOFF,
     DEFAULT_TIMEOUT,
+    ERROR_CIRCUIT_OPEN,
     ERROR_CONNECTION,
     ERROR_HTTP,
     ERROR_TEMPLATE,
@@ -29,10 +52,268 @@ from .const import (
     EVENT_WEBHOOK_ERROR,
     EVENT_WEBHOOK_SUCCESS,
     MAX_RESPONSE_SIZE,
+    RETRY_JITTER,
+    RETRY_MAX_BACKOFF,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Finds "{{" or "{%" in a single pass over the string
+_HAS_TEMPLATE = re.compile(r"\{[{%]").search
+
+# Object or array start after optional whitespace, for responses not labelled as JSON
+_LOOKS_LIKE_JSON = re.compile(rb"\s*[\[{]").match
+
+# Methods that send a request body
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# (static payload, container paths holding templates, templated leaves)
+_PayloadPlan = tuple[Any, list[tuple[Any, ...]], list[tuple[tuple[Any, ...], Template]]]
+
+
+# Templates kept per executor; override templates beyond this reset the cache
+_TEMPLATE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=32)
+def _timeout_for(total: float) -> aiohttp.ClientTimeout:
+    """Return a shared (immutable) ClientTimeout for a total timeout."""
+    return aiohttp.ClientTimeout(total=total)
+
+
+def _is_template(value: Any) -> bool:
+    """Return True if value is a string containing template markers."""
+    return isinstance(value, str) and _HAS_TEMPLATE(value) is not None
+
+
+def _parse_json_string(value: Any) -> Any:
+    """Parse a string that looks like JSON, otherwise return it unchanged."""
+    if isinstance(value, str) and value.strip().startswith(("{", "[")):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
+
+
+def _retry_after(err: aiohttp.ClientResponseError) -> float | None:
+    """Return the Retry-After delay in seconds of a 429/503 response, if given."""
+    if err.status not in (429, 503) or not err.headers:
+        return None
+    value = err.headers.get("Retry-After")
+    if value and value.isdigit():
+        return float(value)
+    return None
+
+
+def _encode_body(method: str, payload: Any) -> bytes | str | None:
+    """Encode a rendered payload as a request body (JSON bytes for dicts and lists)."""
+    if method not in _BODY_METHODS or payload is None:
+        return None
+    if isinstance(payload, (dict, list)):
+        return json_bytes(payload)
+    return str(payload)
+
+
+def _response_encoding(charset: str | None) -> str:
+    """Return a usable codec for a response charset, falling back to utf-8."""
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except (LookupError, ValueError):
+            pass
+    return "utf-8"
+
+
+def _json_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Add the JSON Content-Type unless the headers already set one."""
+    if any(key.lower() == "content-type" for key in headers):
+        return headers
+    return {**DEFAULT_HEADERS, **headers}
+
+
+# Request failures by exception type: (error type, log level, log label)
+_REQUEST_ERRORS: dict[type[BaseException], tuple[str, int, str]] = {
+    aiohttp.ClientConnectorError: (ERROR_CONNECTION, logging.WARNING, "Connection error"),
+    asyncio.TimeoutError: (ERROR_TIMEOUT, logging.WARNING, "Timeout"),
+    aiohttp.ClientResponseError: (ERROR_HTTP, logging.WARNING, "HTTP error"),
+}
+_UNEXPECTED_ERROR = (ERROR_CONNECTION, logging.ERROR, "Unexpected error")
+
+
+def _classify_error(err: Exception) -> tuple[str, int, str]:
+    """Look up how a request failure is reported, matching subclasses via the MRO."""
+    for cls in type(err).__mro__:
+        if (kind := _REQUEST_ERRORS.get(cls)) is not None:
+            return kind
+    return _UNEXPECTED_ERROR
+
+
+@dataclass(slots=True)
+class _BreakerState:
+    """Circuit breaker for a webhook target host (closed -> open -> half open)."""
+
+    failures: int = 0
+    opened_at: float = 0.0
+    state: str = "closed"
+
+    def allow_request(self) -> bool:
+        """Return True if a call to the host may proceed."""
+        if self.state == "closed":
+            return True
+
+        now = time.monotonic()
+        if now - self.opened_at < CIRCUIT_COOLDOWN:
+            return False
+
+        # Cooldown elapsed: let a single probe through (another one if it never reports back)
+        self.state = "half_open"
+        self.opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after the host responded."""
+        self.failures = 0
+        self.state = "closed"
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit once the threshold is reached."""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= CIRCUIT_THRESHOLD:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+
+# Circuit breakers shared by all executors, keyed by target host
+_BREAKERS: dict[str, _BreakerState] = {}
+
+
+def _get_breaker(host: str) -> _BreakerState:
+    """Return the circuit breaker for a host, evicting old ones when at capacity."""
+    if (breaker := _BREAKERS.get(host)) is None:
+        if len(_BREAKERS) >= CIRCUIT_MAX_HOSTS:
+            # Healthy breakers carry no state; drop them first, then the oldest
+            for key in [k for k, b in _BREAKERS.items() if b.state == "closed" and not b.failures]:
+                del _BREAKERS[key]
+            if len(_BREAKERS) >= CIRCUIT_MAX_HOSTS:
+                del _BREAKERS[next(iter(_BREAKERS))]
+        breaker = _BREAKERS[host] = _BreakerState()
+    return breaker
+
+
+def _url_host(url: Any) -> str | None:
+    """Return the host of a URL, or None if it cannot be parsed."""
+    try:
+        return URL(url).host
+    except (TypeError, ValueError):
+        # Malformed URLs fail (and are reported) when the request is made
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class ExecutionPlan:
+    """Webhook settings resolved once from the webhook configuration."""
+
+    webhook_id: str
+    url: str
+    method: str
+    headers: dict[str, str]
+    payload: Any
+    timeout: float
+    retry_attempts: int
+    retry_backoff: int
+    batch_size: int
+    batch_wait: float
+    url_is_template: bool
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "ExecutionPlan":
+        """Build an execution plan from a webhook configuration."""
+        headers = {
+            key: value if _is_template(value) else str(value)
+            for key, value in (config.get(CONF_HEADERS) or {}).items()
+        }
+        return cls(
+            webhook_id=config.get(CONF_WEBHOOK_ID, "unknown"),
+            url=config.get(CONF_URL),
+            method=config.get(CONF_METHOD, DEFAULT_METHOD).upper(),
+            headers=headers,
+            payload=config.get(CONF_PAYLOAD),
+            # Ensure numeric types (timeout can be float for aiohttp, others should be int)
+            timeout=float(config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)),
+            retry_attempts=int(config.get(CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS)),
+            retry_backoff=int(config.get(CONF_RETRY_BACKOFF, DEFAULT_RETRY_BACKOFF)),
+            batch_size=int(config.get(CONF_BATCH_SIZE, DEFAULT_BATCH_SIZE)),
+            batch_wait=int(config.get(CONF_BATCH_WAIT_MS, DEFAULT_BATCH_WAIT_MS)) / 1000,
+            url_is_template=_is_template(config.get(CONF_URL)),
+        )
+
+
+class _WebhookBatcher:
+    """Collect concurrent payloads for a webhook and send them as one request."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[[list[Any]], Awaitable[dict[str, Any]]],
+        max_size: int,
+        max_wait: float,
+    ) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self._send = send
+        self._max_size = max_size
+        self._max_wait = max_wait
+        self._pending: list[tuple[Any, asyncio.Future[dict[str, Any]]]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    async def async_submit(self, payload: Any) -> dict[str, Any]:
+        """Queue a payload and return the response of the batch it was sent in."""
+        future: asyncio.Future[dict[str, Any]] = self.hass.loop.create_future()
+        self._pending.append((payload, future))
+
+        if len(self._pending) >= self._max_size:
+            self._async_flush()
+        elif self._unsub_timer is None:
+            self._unsub_timer = async_call_later(self.hass, self._max_wait, self._async_flush)
+
+        return await future
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Send all pending payloads as one batch."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            # Background task: shutdown cancels it rather than waiting on the request
+            self.hass.async_create_background_task(
+                self._async_send(batch), "webhook_actions batch send"
+            )
+
+    async def _async_send(
+        self, batch: list[tuple[Any, asyncio.Future[dict[str, Any]]]]
+    ) -> None:
+        """Send a batch and resolve its waiters with the shared response."""
+        try:
+            response = await self._send([payload for payload, _ in batch])
+        except asyncio.CancelledError:
+            # Don't leave callers waiting on a batch that will never be sent
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as err:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for _, future in batch:
+            if not future.done():
+                future.set_result(response)
+
 
 class WebhookExecutor:
     """Handle webhook execution with retry logic and template support."""
@@ -41,148 +322,299 @@ class WebhookExecutor:
         """Initialize webhook executor."""
         self.hass = hass
         self.config = config
+        self.plan = plan = ExecutionPlan.from_config(config)
+        # HA's shared session already pools keep-alive connections and is closed on shutdown
         self.session = async_get_clientsession(hass)
 
+        # Precompile templates once so execute() only renders them. The cache lives on the
+        # executor so it is released with it (on webhook update, removal or unload).
+        self._templates: dict[str, Template] = {}
+        self._url_template = (
+            self._get_template(plan.url) if plan.url_is_template else None
+        )
+        self._header_templates = [
+            (key, self._get_template(value))
+            for key, value in plan.headers.items()
+            if _is_template(value)
+        ]
+        self._payload_plan = self._compile_payload(plan.payload)
+        static_payload, _, payload_templates = self._payload_plan
+
+        # A payload without templates is encoded once and reused for every call and retry
+        self._payload_is_static = not payload_templates
+        self._static_body = (
+            _encode_body(plan.method, static_payload) if self._payload_is_static else None
+        )
+        self._host = None if plan.url_is_template else _url_host(plan.url)
+
+        # Fully static webhooks skip the render pass and send these cached values
+        self._has_templates = bool(
+            plan.url_is_template or self._header_templates or payload_templates
+        )
+        self._static_headers = (
+            _json_headers(plan.headers)
+            if isinstance(self._static_body, bytes)
+            else plan.headers
+        )
+        self._default_timeout = _timeout_for(plan.timeout)
+
+        # Opt-in batching of concurrent calls into a single request
+        self._batcher = (
+            _WebhookBatcher(hass, self._async_send_batch, plan.batch_size, plan.batch_wait)
+            if plan.batch_size > 1 and plan.method in _BODY_METHODS
+            else None
+        )
+
     async def execute(
         self,
         url_override: str | None = None,
         headers_override: dict[str, str] | None = None,
         payload_override: Any | None = None,
         timeout_override: int | None = None,
+        include_headers: bool = True,
     ) -> dict[str, Any]:
-        """Execute webhook with retry logic."""
-        webhook_id = self.config.get(CONF_WEBHOOK_ID, "unknown")
+        """Execute webhook with retry logic.
+
+        Response headers are only copied out of aiohttp when include_headers is set.
+        """
+        plan = self.plan
+        timeout = (
+            _timeout_for(float(timeout_override))
+            if timeout_override
+            else self._default_timeout
+        )
+
+        if not (
+            self._has_templates
+            or self._batcher is not None
+            or url_override
+            or headers_override
+            or payload_override is not None
+        ):
+            return await self._async_send(
+                plan.url, self._static_headers, self._static_body, timeout, include_headers
+            )
+
+        # Render templates (configured ones were precompiled in __init__)
+        try:
+            if payload_override is not None:
+                payload = self._render_payload(self._compile_payload(payload_override))
+            else:
+                payload = self._render_payload(self._payload_plan)
+
+            # Calls to the configured target are batched; URL and headers are rendered per batch.
+            # Calls without a payload send no body, so there is nothing to batch.
+            if (
+                self._batcher is not None
+                and payload is not None
+                and not (url_override or headers_override or timeout_override)
+            ):
+                return await self._batcher.async_submit(payload)
+
+            url, headers = self._render_target(url_override, headers_override)
+        except TemplateError as err:
+            await self._async_template_failed(err)
+            raise
 
-        # Build final configuration with overrides
-        url = url_override or self.config.get(CONF_URL)
-        method = self.config.get(CONF_METHOD, "POST")
-        headers = self.config.get(CONF_HEADERS, {}).copy()
+        if payload_override is None and self._payload_is_static:
+            body = self._static_body
+        else:
+            body = _encode_body(plan.method, payload)
 
-        if headers_override:
-            headers.update(headers_override)
+        # Pre-encoded JSON is sent as raw bytes, so set the Content-Type aiohttp's json= would
+        if isinstance(body, bytes):
+            headers = _json_headers(headers)
 
-        payload = payload_override if payload_override is not None else self.config.get(CONF_PAYLOAD)
-        # Ensure numeric types (timeout can be float for aiohttp, others should be int)
-        timeout = float(timeout_override or self.config.get(CONF_TIMEOUT, DEFAULT_TIMEOUT))
-        retry_attempts = int(self.config.get(CONF_RETRY_ATTEMPTS, DEFAULT_RETRY_ATTEMPTS))
-        retry_backoff = int(self.config.get(CONF_RETRY_BACKOFF, DEFAULT_RETRY_BACKOFF))
+        return await self._async_send(url, headers, body, timeout, include_headers)
 
-        # Render templates
+    async def _async_send_batch(self, payloads: list[Any]) -> dict[str, Any]:
+        """Send a batch of payloads to the configured target as a single request."""
+        batch_size = len(payloads)
         try:
-            url = await self._render_template(url)
-            headers = await self._render_headers(headers)
-            payload = await self._render_payload(payload)
+            url, headers = self._render_target(None, None)
         except TemplateError as err:
-            _LOGGER.error("Template rendering failed for webhook %s: %s", webhook_id, err)
-            await self._fire_error_event(webhook_id, ERROR_TEMPLATE, str(err), 0)
+            await self._async_template_failed(err, batch_size)
             raise
 
+        body = _encode_body(self.plan.method, {BATCH_ROOT_KEY: payloads})
+        return await self._async_send(
+            url, _json_headers(headers), body, self._default_timeout, True, batch_size
+        )
+
+    def _render_target(
+        self,
+        url_override: str | None,
+        headers_override: dict[str, str] | None,
+    ) -> tuple[str, dict[str, str]]:
+        """Render the request URL and headers."""
+        plan = self.plan
+
+        url = plan.url
+        if url_override:
+            url = self._render_template(url_override)
+        elif self._url_template is not None:
+            url = self._url_template.async_render()
+
+        # The plan's headers are shared as-is unless something has to be rendered into them
+        headers = plan.headers
+        if self._header_templates:
+            headers = headers.copy()
+            for key, template in self._header_templates:
+                headers[key] = str(template.async_render())
+        if headers_override:
+            headers = {**headers, **self._render_headers(headers_override)}
+
+        return url, headers
+
+    async def _async_template_failed(self, err: TemplateError, batch_size: int = 1) -> None:
+        """Log and report a template rendering failure."""
+        webhook_id = self.plan.webhook_id
+        _LOGGER.error("Template rendering failed for webhook %s: %s", webhook_id, err)
+        await self._fire_error_event(
+            webhook_id, ERROR_TEMPLATE, str(err), 0, batch_size=batch_size
+        )
+
+    async def _async_send(
+        self,
+        url: str,
+        headers: dict[str, str],
+        body: bytes | str | None,
+        timeout: aiohttp.ClientTimeout,
+        include_headers: bool,
+        batch_size: int = 1,
+    ) -> dict[str, Any]:
+        """Send the rendered request, retrying failures and honoring the circuit breaker.
+
+        Headers must be final, including the JSON Content-Type for bytes bodies. A batched
+        request reports one event per call it carries (batch_size).
+        """
+        plan = self.plan
+        webhook_id = plan.webhook_id
+        method = plan.method
+        retry_attempts = plan.retry_attempts
+        retry_backoff = plan.retry_backoff
+
+        # Fail fast while the target host's circuit is open (static URL host parsed in __init__)
+        host = self._host if url is plan.url else _url_host(url)
+        # Unparsable hosts get a throwaway breaker so they never trip each other's circuit
+        breaker = _get_breaker(host) if host is not None else _BreakerState()
+        if not breaker.allow_request():
+            message = f"Circuit open for {host}, skipping webhook {webhook_id}"
+            _LOGGER.warning("Circuit open for %s, skipping webhook %s", host, webhook_id)
+            await self._fire_error_event(
+                webhook_id, ERROR_CIRCUIT_OPEN, message, 0, batch_size=batch_size
+            )
+            raise HomeAssistantError(message)
+
         # Execute with retry logic
         last_error = None
+        host_failed = False
         for attempt in range(retry_attempts):
+            retry_after = None
             try:
                 response_data = await self._make_request(
                     url=url,
                     method=method,
                     headers=headers,
-                    payload=payload,
+                    body=body,
                     timeout=timeout,
+                    include_headers=include_headers,
                 )
 
-                # Success - fire success event
-                self.hass.bus.async_fire(
+                # Success - close the circuit and fire success event
+                breaker.record_success()
+                self._fire_event(
                     EVENT_WEBHOOK_SUCCESS,
                     {
                         "webhook_id": webhook_id,
                         "status_code": response_data["status_code"],
                         "attempt": attempt + 1,
                     },
+                    batch_size,
                 )
 
-                _LOGGER.debug(
-                    "Webhook %s executed successfully on attempt %d: %s",
-                    webhook_id,
-                    attempt + 1,
-                    response_data["status_code"],
-                )
-
-                return response_data
-
-            except aiohttp.ClientConnectorError as err:
-                last_error = (ERROR_CONNECTION, str(err))
-                _LOGGER.warning(
-                    "Connection error for webhook %s (attempt %d/%d): %s",
-                    webhook_id,
-                    attempt + 1,
-                    retry_attempts,
-                    err,
-                )
-
-            except asyncio.TimeoutError as err:
-                last_error = (ERROR_TIMEOUT, str(err))
-                _LOGGER.warning(
-                    "Timeout for webhook %s (attempt %d/%d)",
-                    webhook_id,
-                    attempt + 1,
-                    retry_attempts,
-                )
-
-            except aiohttp.ClientResponseError as err:
-                last_error = (ERROR_HTTP, f"HTTP {err.status}: {err.message}")
-
-                # Don't retry on 4xx errors (except 429 rate limit)
-                if 400 <= err.status < 500 and err.status != 429:
-                    _LOGGER.error(
-                        "Non-retryable HTTP error for webhook %s: %s",
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Webhook %s executed successfully on attempt %d: %s",
                         webhook_id,
-                        last_error[1],
-                    )
-                    await self._fire_error_event(
-                        webhook_id,
-                        last_error[0],
-                        last_error[1],
                         attempt + 1,
-                        err.status,
+                        response_data["status_code"],
                     )
-                    raise
 
-                _LOGGER.warning(
-                    "HTTP error for webhook %s (attempt %d/%d): %s",
-                    webhook_id,
-                    attempt + 1,
-                    retry_attempts,
-                    last_error[1],
-                )
+                return response_data
 
             except Exception as err:
-                last_error = (ERROR_CONNECTION, str(err))
-                _LOGGER.error(
-                    "Unexpected error for webhook %s (attempt %d/%d): %s",
+                error_type, level, label = _classify_error(err)
+                if isinstance(err, aiohttp.ClientResponseError):
+                    error_message = f"HTTP {err.status}: {err.message}"
+                    retry_after = _retry_after(err)
+
+                    # Don't retry on 4xx errors (except 429 rate limit)
+                    if 400 <= err.status < 500 and err.status != 429:
+                        # The host is up and answering, so this does not count against it
+                        breaker.record_success()
+                        _LOGGER.error(
+                            "Non-retryable HTTP error for webhook %s: %s",
+                            webhook_id,
+                            error_message,
+                        )
+                        await self._fire_error_event(
+                            webhook_id,
+                            error_type,
+                            error_message,
+                            attempt + 1,
+                            err.status,
+                            batch_size,
+                        )
+                        raise
+                else:
+                    error_message = str(err)
+
+                # HomeAssistantError is raised on an oversized response, so the host is up and
+                # answering and this does not count against it either
+                host_failed = not isinstance(err, HomeAssistantError)
+                if not host_failed:
+                    breaker.record_success()
+
+                last_error = (error_type, error_message)
+                _LOGGER.log(
+                    level,
+                    "%s for webhook %s (attempt %d/%d): %s",
+                    label,
                     webhook_id,
                     attempt + 1,
                     retry_attempts,
-                    err,
+                    error_message or type(err).__name__,
                 )
 
-            # Wait before retry (exponential backoff)
+            # Wait before retry (server-requested delay or capped exponential backoff with jitter)
             if attempt < retry_attempts - 1:
-                wait_time = int(retry_backoff ** attempt)
-                _LOGGER.debug(
-                    "Waiting %d seconds before retry %d for webhook %s",
-                    wait_time,
-                    attempt + 2,
-                    webhook_id,
-                )
+                if retry_after is not None:
+                    wait_time = min(RETRY_MAX_BACKOFF, retry_after)
+                else:
+                    wait_time = min(RETRY_MAX_BACKOFF, retry_backoff * 2**attempt) * (
+                        1 + random.uniform(0, RETRY_JITTER)
+                    )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Waiting %.1f seconds before retry %d for webhook %s",
+                        wait_time,
+                        attempt + 2,
+                        webhook_id,
+                    )
                 await asyncio.sleep(wait_time)
 
-        # All retries exhausted
+        # All retries exhausted (only count against the host if a request was actually made)
         if last_error:
+            if host_failed:
+                breaker.record_failure()
             error_type, error_message = last_error
             await self._fire_error_event(
                 webhook_id,
                 error_type,
                 error_message,
                 retry_attempts,
+                batch_size=batch_size,
             )
             raise HomeAssistantError(f"Webhook {webhook_id} failed after {retry_attempts} attempts: {error_message}")
 
@@ -191,116 +623,150 @@ class WebhookExecutor:
         url: str,
         method: str,
         headers: dict[str, str],
-        payload: Any,
-        timeout: int | float,
+        body: bytes | str | None,
+        timeout: aiohttp.ClientTimeout,
+        include_headers: bool = True,
     ) -> dict[str, Any]:
         """Make HTTP request and return response data."""
         request_kwargs = {
             "headers": headers,
-            "timeout": aiohttp.ClientTimeout(total=timeout),
+            "timeout": timeout,
         }
 
-        # Add payload for methods that support body
-        if method.upper() in ["POST", "PUT", "PATCH"] and payload is not None:
-            if isinstance(payload, (dict, list)):
-                request_kwargs["json"] = payload
-            else:
-                request_kwargs["data"] = str(payload)
+        # Add body for methods that support it
+        if body is not None:
+            request_kwargs["data"] = body
 
-        _LOGGER.debug("Making %s request to %s", method, url)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Making %s request to %s", method, url)
 
         async with self.session.request(method, url, **request_kwargs) as response:
             # Raise for 4xx and 5xx status codes
             response.raise_for_status()
 
-            # Check response size from headers
+            # Fail fast on a declared oversized body; the bounded read below enforces the limit otherwise
             content_length = response.headers.get("Content-Length")
-            if content_length:
-                try:
-                    if int(content_length) > MAX_RESPONSE_SIZE:
-                        raise HomeAssistantError(
-                            f"Response size ({content_length} bytes) exceeds maximum allowed ({MAX_RESPONSE_SIZE} bytes)"
-                        )
-                except ValueError:
-                    pass  # Invalid Content-Length header, continue anyway
+            if content_length and content_length.isdigit() and int(content_length) > MAX_RESPONSE_SIZE:
+                raise HomeAssistantError(
+                    f"Response size ({content_length} bytes) exceeds maximum allowed ({MAX_RESPONSE_SIZE} bytes)"
+                )
 
-            # Parse response - get text first with size limit
-            response_text = await response.text()
+            # Read raw bytes, stopping one byte past the limit to detect oversized bodies
+            body = bytearray()
+            while len(body) <= MAX_RESPONSE_SIZE:
+                chunk = await response.content.read(MAX_RESPONSE_SIZE + 1 - len(body))
+                if not chunk:
+                    break
+                body += chunk
 
-            # Check actual size after reading and truncate if needed
-            response_bytes = response_text.encode('utf-8')
-            if len(response_bytes) > MAX_RESPONSE_SIZE:
+            if len(body) > MAX_RESPONSE_SIZE:
                 _LOGGER.warning(
-                    "Response size (%d bytes) exceeds limit, truncating to %d bytes",
-                    len(response_bytes),
-                    MAX_RESPONSE_SIZE
+                    "Response size exceeds limit, truncating to %d bytes",
+                    MAX_RESPONSE_SIZE,
                 )
-                # Truncate to max size in bytes, then decode
-                response_text = response_bytes[:MAX_RESPONSE_SIZE].decode('utf-8', errors='ignore')
+                del body[MAX_RESPONSE_SIZE:]
 
+            # Decode once; UTF-8 JSON is parsed from the raw bytes (orjson only reads UTF-8)
+            encoding = _response_encoding(response.charset)
+            response_text = body.decode(encoding, errors="ignore")
             response_json = None
 
-            # Try to parse JSON from text
-            if response_text:
+            # Only JSON responses (or bodies that look like JSON) are worth parsing
+            content_type = response.content_type
+            if body and (
+                content_type == "application/json"
+                or content_type.endswith("+json")
+                or _LOOKS_LIKE_JSON(body)
+            ):
                 try:
-                    response_json = json.loads(response_text)
-                except json.JSONDecodeError:
+                    response_json = json_loads(body if encoding == "utf-8" else response_text)
+                except JSON_DECODE_EXCEPTIONS:
                     pass
 
             return {
                 "status_code": response.status,
-                "headers": dict(response.headers),
+                "headers": dict(response.headers) if include_headers else {},
                 "body": response_text,
                 "json": response_json,
             }
 
-    async def _render_template(self, value: Any) -> str | Any:
-        """Render a template value."""
-        if not isinstance(value, str):
-            return value
+    def _get_template(self, value: str) -> Template:
+        """Return a cached Template so its compiled form is reused across calls."""
+        if (template := self._templates.get(value)) is None:
+            if len(self._templates) >= _TEMPLATE_CACHE_SIZE:
+                self._templates.clear()
+            template = self._templates[value] = Template(value, self.hass)
+        return template
 
-        if "{{" in value or "{%" in value:
-            template = Template(value, self.hass)
-            return template.async_render()
+    def _render_template(self, value: Any) -> str | Any:
+        """Render a template value."""
+        if _is_template(value):
+            return self._get_template(value).async_render()
 
         return value
 
-    async def _render_headers(self, headers: dict[str, str]) -> dict[str, str]:
+    def _render_headers(self, headers: dict[str, str]) -> dict[str, str]:
         """Render all header values."""
         rendered: dict[str, str] = {}
         for key, value in headers.items():
-            rendered[key] = str(await self._render_template(value))
+            rendered[key] = str(self._render_template(value))
         return rendered
 
-    async def _render_payload(self, payload: Any) -> Any:
-        """Render payload with template support recursively."""
-        if payload is None:
-            return None
-
-        # If payload is a string, try to render it
-        if isinstance(payload, str):
-            rendered = await self._render_template(payload)
-            # Try to parse as JSON if it looks like JSON
-            if rendered.strip().startswith(("{", "[")):
-                try:
-                    return json.loads(rendered)
-                except json.JSONDecodeError:
-                    pass
-            return rendered
-
-        # If payload is a dict, render each value recursively
-        if isinstance(payload, dict):
-            rendered = {}
-            for key, value in payload.items():
-                # Recursively render nested structures
-                rendered[key] = await self._render_payload(value)
-            return rendered
+    def _compile_payload(self, payload: Any) -> _PayloadPlan:
+        """Split a payload into its static part and the templates to render per call.
+
+        Returns the payload with literal JSON strings already parsed, the paths
+        of containers holding templates (parents first), and the templated
+        leaves as (path, template) pairs.
+        """
+        spine: set[tuple[Any, ...]] = set()
+        templates: list[tuple[tuple[Any, ...], Template]] = []
+
+        # Iterative walk over (container, key, path); containers are copied so the
+        # config is never mutated when literal JSON strings are parsed in place
+        root = [payload]
+        stack: list[tuple[Any, Any, tuple[Any, ...]]] = [(root, 0, ())]
+        while stack:
+            parent, key, path = stack.pop()
+            node = parent[key]
+
+            if isinstance(node, str):
+                if _is_template(node):
+                    templates.append((path, self._get_template(node)))
+                    spine.update(path[:depth] for depth in range(len(path)))
+                else:
+                    parent[key] = _parse_json_string(node)
+            elif isinstance(node, dict):
+                node = parent[key] = dict(node)
+                stack.extend((node, child, (*path, child)) for child in node)
+            elif isinstance(node, list):
+                node = parent[key] = list(node)
+                stack.extend((node, index, (*path, index)) for index in range(len(node)))
+
+        return root[0], sorted(spine, key=len), templates
+
+    def _render_payload(self, payload_plan: _PayloadPlan) -> Any:
+        """Render a compiled payload, copying only containers that hold templates."""
+        static, spine, templates = payload_plan
+        if not templates:
+            return static
+
+        copies: dict[tuple[Any, ...], Any] = {}
+        for path in spine:
+            if path:
+                parent = copies[path[:-1]]
+                node = parent[path[-1]] = parent[path[-1]].copy()
+            else:
+                node = static.copy()
+            copies[path] = node
 
-        # If payload is a list, render each item recursively
-        if isinstance(payload, list):
-            return [await self._render_payload(item) for item in payload]
+        for path, template in templates:
+            value = _parse_json_string(template.async_render())
+            if not path:
+                return value
+            copies[path[:-1]][path[-1]] = value
 
-        return payload
+        return copies[()]
 
     async def _fire_error_event(
         self,
@@ -309,6 +775,7 @@ class WebhookExecutor:
         error_message: str,
         attempt: int,
         status_code: int | None = None,
+        batch_size: int = 1,
     ) -> None:
         """Fire error event for failed webhook."""
         event_data = {
@@ -321,4 +788,15 @@ class WebhookExecutor:
         if status_code:
             event_data["status_code"] = status_code
 
-        self.hass.bus.async_fire(EVENT_WEBHOOK_ERROR, event_data)
+        self._fire_event(EVENT_WEBHOOK_ERROR, event_data, batch_size)
+
+    @callback
+    def _fire_event(self, event_type: str, event_data: dict[str, Any], batch_size: int) -> None:
+        """Fire an event once per call, so batched calls are reported like single ones."""
+        if batch_size == 1:
+            self.hass.bus.async_fire(event_type, event_data)
+            return
+
+        event_data["batch_size"] = batch_size
+        for _ in range(batch_size):
+            self.hass.bus.async_fire(event_type, dict(event_data))